@@ -1,383 +1,493 @@
 #!/usr/bin/env python3
-import argparse
-from pathlib import Path
+from functools import cache
+import os
 import sys
-from textwrap import dedent
 
+# Same effect as typing.TYPE_CHECKING without importing typing at runtime
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import argparse
 
-# -------------------- UTIL --------------------
-def write_file(path: Path, content: str, force: bool = False) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    if path.exists() and not force:
-        return
-    path.write_text(content, encoding="utf-8")
+_INIT_BYTES = b"# Auto-generated __init__.py\n"
 
+# Overwrite in place when forcing, otherwise only create missing files
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+_CREATE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL
 
-def write_init(path: Path, force: bool = False) -> None:
-    """Ensure __init__.py exists in a directory."""
-    init_file = path / "__init__.py"
-    if not init_file.exists() or force:
-        init_file.write_text("# Auto-generated __init__.py\n", encoding="utf-8")
 
+# -------------------- UTIL --------------------
+def _nonempty(path: str) -> bool:
+    """Return True if the directory exists and holds at least one entry."""
+    try:
+        with os.scandir(path) as entries:
+            return next(entries, None) is not None
+    except FileNotFoundError:
+        return False
+
+
+def _join(*parts: str) -> str:
+    """Join path parts, leaving ".." to the OS so symlinks resolve as before."""
+    path = os.path.join(*parts)
+    # Drop a leading "./" like pathlib does, purely for the printed paths
+    while path.startswith("." + os.sep) and len(path) > 2:
+        path = path[2:].lstrip(os.sep)
+    return path
+
+
+def _fast_write(path: str, data: bytes, flags: int = _WRITE_FLAGS) -> None:
+    """Write data with a bare os.open/os.write/os.close, skipping io wrappers."""
+    fd = os.open(path, flags, 0o644)
+    try:
+        # os.write may write fewer bytes than asked; keep going until done
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def write_file(path: str, content: bytes, force: bool = False) -> None:
+    try:
+        _fast_write(path, content, _WRITE_FLAGS if force else _CREATE_FLAGS)
+    except FileExistsError:
+        pass
+
+
+def make_dirs(dirs: set[str]) -> None:
+    """Create the deepest directories first, skipping ancestors already made."""
+    created: set[str] = set()
+    for d in sorted(dirs, key=lambda p: p.count(os.sep), reverse=True):
+        if d in created:
+            continue
+        os.makedirs(d, exist_ok=True)
+        while d and d not in created:
+            created.add(d)
+            d = os.path.dirname(d)
+
+
+def _is_init(path: str) -> bool:
+    """__init__.py files are only ever created, never overwritten by --force."""
+    return os.path.basename(path) == "__init__.py"
+
+
+def write_plan(plan: list[tuple[str, bytes]], force: bool = False) -> None:
+    """Create each parent directory once, then write the planned files."""
+    make_dirs({os.path.dirname(path) for path, _ in plan})
+    for path, content in plan:
+        write_file(path, content, force and not _is_init(path))
+
+
+def write_archive(path: str, prefix: str, plan: list[tuple[str, bytes]]) -> None:
+    """Stream the plan into a tar file, placing every entry under prefix/."""
+    # Imported lazily, only the --archive mode needs them
+    import io
+    import tarfile
+    import time
+
+    mtime = int(time.time())
+    with tarfile.open(path, mode="w|") as tar:
+        for name, content in plan:
+            info = tarfile.TarInfo(f"{prefix}/{name.replace(os.sep, '/')}")
+            info.size = len(content)
+            info.mode = 0o644
+            info.mtime = mtime
+            tar.addfile(info, io.BytesIO(content))
 
-# -------------------- FILES --------------------
-def make_pyproject(project_name: str) -> str:
-    return dedent(f"""
-    [project]
-    name = "{project_name}"
-    version = "0.1.0"
-    description = "DDD FastAPI service"
-    requires-python = ">=3.11"
-    dependencies = [
-      "fastapi[all]>=0.116.1",
-      "pydantic>=2.3.0",
-      "python-dotenv",
-    ]
 
-    [tool.pytest.ini_options]
-    addopts = "-q"
-    testpaths = ["tests"]
-    """).lstrip()
-
-
-def make_requirements() -> str:
-    return dedent("""
-    fastapi[all]==0.116.1
-    pydantic>=2.3.0
-    python-dotenv
-    """).lstrip()
-
-
-def make_importlinter() -> str:
-    return dedent("""
-    [importlinter]
-    root_package = src
-
-    [importlinter:contract:layered-architecture]
-    name = Layered architecture
-    type = layers
-    layers =
-        src.api
-        src.infrastructure
-        src.application
-        src.domain
-    rules =
-        src.api -> src.infrastructure
-        src.infrastructure -> src.application
-        src.application -> src.domain
-    """).lstrip()
-
-
-def make_dockerfile() -> str:
-    return dedent("""
-    # syntax=docker/dockerfile:1.4
-    FROM python:3.12-slim AS base
-    WORKDIR /app
-    COPY requirements.txt .
-    RUN --mount=type=cache,target=/root/.cache/pip \
+# -------------------- FILES --------------------
+_PYPROJECT_TEMPLATE = b"""\
+[project]
+name = "__NAME__"
+version = "0.1.0"
+description = "DDD FastAPI service"
+requires-python = ">=3.11"
+dependencies = [
+  "fastapi[all]>=0.116.1",
+  "pydantic>=2.3.0",
+  "python-dotenv",
+]
+
+[tool.pytest.ini_options]
+addopts = "-q"
+testpaths = ["tests"]
+"""
+
+
+@cache
+def make_pyproject(project_name: str) -> bytes:
+    return _PYPROJECT_TEMPLATE.replace(b"__NAME__", project_name.encode())
+
+
+REQUIREMENTS = b"""\
+fastapi[all]==0.116.1
+pydantic>=2.3.0
+python-dotenv
+"""
+
+
+IMPORTLINTER = b"""\
+[importlinter]
+root_package = src
+
+[importlinter:contract:layered-architecture]
+name = Layered architecture
+type = layers
+layers =
+    src.api
+    src.infrastructure
+    src.application
+    src.domain
+rules =
+    src.api -> src.infrastructure
+    src.infrastructure -> src.application
+    src.application -> src.domain
+"""
+
+
+DOCKERFILE = b"""\
+# syntax=docker/dockerfile:1.4
+FROM python:3.12-slim AS base
+WORKDIR /app
+COPY requirements.txt .
+RUN --mount=type=cache,target=/root/.cache/pip \
         pip install --upgrade pip && pip install -r requirements.txt
 
-    FROM base AS final
-    COPY . .
-    EXPOSE 8000
-    CMD ["uvicorn", "src.main:app", "--host", "0.0.0.0", "--port", "8000"]
-    """).lstrip()
-
-
-def make_compose(project_name: str) -> str:
-    return dedent(f"""
-    services:
-      app:
-        build:
-          context: ../
-          dockerfile: Dockerfile
-        container_name: {project_name}-app
-        ports:
-          - "8000:8000"
-        volumes:
-          - ../:/app
-        env_file:
-          - ../src/.env
-        command: uvicorn src.main:app --host 0.0.0.0 --port 8000 --reload
-    """).lstrip()
-
-
-def make_makefile() -> str:
-    return (
-        ".PHONY: run test test-cov lint format precommit-install up down shell sec contracts clean-pyc\n\n"
-        "COMPOSE_DEV = docker compose -f infra/docker-compose.yml\n\n"
-        "run:\n"
-        "\tuvicorn src.main:app --host 0.0.0.0 --port 8000 --reload\n\n"
-        "test:\n"
-        "\tPYTHONPATH=. pytest -q\n\n"
-        "test-cov:\n"
-        "\tPYTHONPATH=. pytest --cov=src --cov-report=term-missing\n\n"
-        "lint:\n"
-        "\truff check --config=ruff.toml src/ --fix\n\n"
-        "format:\n"
-        '\truff check --config=pyproject.toml src --fix --select I --exclude "migrations"\n'
-        "\truff format src\n\n"
-        "precommit-install:\n"
-        "\tpython -m pip install pre-commit && pre-commit install\n\n"
-        "build:\n"
-        "\t$(COMPOSE_DEV) build --no-cache\n\n"
-        "up:\n"
-        "\t$(COMPOSE_DEV) up\n\n"
-        "down:\n"
-        "\t$(COMPOSE_DEV) down\n\n"
-        "shell:\n"
-        "\t$(COMPOSE_DEV) exec -it app bash\n\n"
-        "sec:\n"
-        "\tbandit -r src && \\\n"
-        "\tpip-audit -r requirements-tests.txt\n\n"
-        "contracts:\n"
-        "\tlint-imports\n\n"
-        "clean-pyc:\n"
-        '\tfind . -type d -name "__pycache__" -exec rm -rf {} +\n'
-        '\tfind . -type f -name "*.pyc" -delete\n'
-        '\tfind . -type f -name "*.pyo" -delete\n'
-    )
-
-
-def make_gitignore() -> str:
-    return dedent("""
-    __pycache__/
-    *.pyc
-    .env
-    .venv/
-    .env.local
-    .cache/
-    htmlcov/
-    coverage.xml
-    .idea/
-    .vscode/
-    """).lstrip()
-
-
-def make_pytest_ini() -> str:
-    return dedent("""
-    [pytest]
-    addopts = -ra -q
-    python_files = test_*.py
-    python_classes = Test*
-    testpaths = tests 
-    """).lstrip()
-
-
-def make_ruff_toml() -> str:
-    return dedent("""
-    line-length = 120
-
-    [lint]
-    select = [
-        "ANN001", # missing-type-function-argument
-        "ANN002", # missing-type-args
-        "ANN003", # missing-type-kwargs
-        "ANN201", # missing-return-type-undocumented-public-function
-        "ANN202", # missing-return-type-private-function
-        "ANN205", # missing-return-type-static-method
-        "ANN206", # missing-return-type-class-method
-        "ANN401", # any_type
-        "B904",   # raise-without-from-inside-except
-        "RSE102", # Unnecessary parentheses on raised exception
-        "T20",    # print_found
-        "TRY002", # raise-vanilla-class
-        "C4",     # flake8-comprehensions
-        "E",      # pycodestyle errors
-        "F",      # pyflakes
-        "I",      # isort
-        "ICN",    # flake8-import-conventions
-        "ISC",    # flake8-str-concat
-        "RET",    # flake8-return
-        "RUF",    # ruff
-        "SIM",    # common simplification rules
-        "UP",     # pyupgrade
-        "W"       # pycodestyle warnings
-    ]
-    """).lstrip()
-
-
-def make_requirements_tests() -> str:
-    return dedent("""
-    -r requirements.txt
-    pytest==8.4.1
-    pytest-cov==6.2.1
-    pytest-mock==3.14.1
-    bandit==1.8.5
-    pip-audit==2.7.3
-    import-linter==2.3
-    ruff
-    """).lstrip()
-
-
-def make_precommit() -> str:
-    return dedent("""
-    repos:
-      - repo: https://github.com/astral-sh/ruff-pre-commit
-        rev: v0.6.4
-        hooks:
-          - id: ruff
-          - id: ruff-format
-      - repo: https://github.com/pre-commit/pre-commit-hooks
-        rev: v4.6.0
-        hooks:
-          - id: end-of-file-fixer
-          - id: trailing-whitespace
-    """).lstrip()
-
-
-def make_env_example() -> str:
-    return dedent("""
-    # Example environment variables
-    APP_ENV=development
-    APP_DEBUG=true
-    """).lstrip()
-
+FROM base AS final
+COPY . .
+EXPOSE 8000
+CMD ["uvicorn", "src.main:app", "--host", "0.0.0.0", "--port", "8000"]
+"""
+
+
+_COMPOSE_TEMPLATE = b"""\
+services:
+  app:
+    build:
+      context: ../
+      dockerfile: Dockerfile
+    container_name: __NAME__-app
+    ports:
+      - "8000:8000"
+    volumes:
+      - ../:/app
+    env_file:
+      - ../src/.env
+    command: uvicorn src.main:app --host 0.0.0.0 --port 8000 --reload
+"""
+
+
+@cache
+def make_compose(project_name: str) -> bytes:
+    return _COMPOSE_TEMPLATE.replace(b"__NAME__", project_name.encode())
+
+
+MAKEFILE = (
+    b".PHONY: run test test-cov lint format precommit-install up down shell sec contracts clean-pyc\n\n"
+    b"COMPOSE_DEV = docker compose -f infra/docker-compose.yml\n\n"
+    b"run:\n"
+    b"\tuvicorn src.main:app --host 0.0.0.0 --port 8000 --reload\n\n"
+    b"test:\n"
+    b"\tPYTHONPATH=. pytest -q\n\n"
+    b"test-cov:\n"
+    b"\tPYTHONPATH=. pytest --cov=src --cov-report=term-missing\n\n"
+    b"lint:\n"
+    b"\truff check --config=ruff.toml src/ --fix\n\n"
+    b"format:\n"
+    b'\truff check --config=pyproject.toml src --fix --select I --exclude "migrations"\n'
+    b"\truff format src\n\n"
+    b"precommit-install:\n"
+    b"\tpython -m pip install pre-commit && pre-commit install\n\n"
+    b"build:\n"
+    b"\t$(COMPOSE_DEV) build --no-cache\n\n"
+    b"up:\n"
+    b"\t$(COMPOSE_DEV) up\n\n"
+    b"down:\n"
+    b"\t$(COMPOSE_DEV) down\n\n"
+    b"shell:\n"
+    b"\t$(COMPOSE_DEV) exec -it app bash\n\n"
+    b"sec:\n"
+    b"\tbandit -r src && \\\n"
+    b"\tpip-audit -r requirements-tests.txt\n\n"
+    b"contracts:\n"
+    b"\tlint-imports\n\n"
+    b"clean-pyc:\n"
+    b"\tfind . \\( -type d -name __pycache__ -prune -o -type f \\( -name '*.pyc' -o -name '*.pyo' \\) \\) -print0 \\\n"
+    b"\t\t| xargs -0 rm -rf\n"
+)
+
+
+GITIGNORE = b"""\
+__pycache__/
+*.pyc
+.env
+.venv/
+.env.local
+.cache/
+htmlcov/
+coverage.xml
+.idea/
+.vscode/
+"""
+
+
+PYTEST_INI = b"""\
+[pytest]
+addopts = -ra -q
+python_files = test_*.py
+python_classes = Test*
+testpaths = tests 
+"""
+
+
+RUFF_TOML = b"""\
+line-length = 120
+
+[lint]
+select = [
+    "ANN001", # missing-type-function-argument
+    "ANN002", # missing-type-args
+    "ANN003", # missing-type-kwargs
+    "ANN201", # missing-return-type-undocumented-public-function
+    "ANN202", # missing-return-type-private-function
+    "ANN205", # missing-return-type-static-method
+    "ANN206", # missing-return-type-class-method
+    "ANN401", # any_type
+    "B904",   # raise-without-from-inside-except
+    "RSE102", # Unnecessary parentheses on raised exception
+    "T20",    # print_found
+    "TRY002", # raise-vanilla-class
+    "C4",     # flake8-comprehensions
+    "E",      # pycodestyle errors
+    "F",      # pyflakes
+    "I",      # isort
+    "ICN",    # flake8-import-conventions
+    "ISC",    # flake8-str-concat
+    "RET",    # flake8-return
+    "RUF",    # ruff
+    "SIM",    # common simplification rules
+    "UP",     # pyupgrade
+    "W"       # pycodestyle warnings
+]
+"""
+
+
+REQUIREMENTS_TESTS = b"""\
+-r requirements.txt
+pytest==8.4.1
+pytest-cov==6.2.1
+pytest-mock==3.14.1
+bandit==1.8.5
+pip-audit==2.7.3
+import-linter==2.3
+ruff
+"""
+
+
+PRECOMMIT = b"""\
+repos:
+  - repo: https://github.com/astral-sh/ruff-pre-commit
+    rev: v0.6.4
+    hooks:
+      - id: ruff
+      - id: ruff-format
+  - repo: https://github.com/pre-commit/pre-commit-hooks
+    rev: v4.6.0
+    hooks:
+      - id: end-of-file-fixer
+      - id: trailing-whitespace
+"""
+
+
+ENV_EXAMPLE = b"""\
+# Example environment variables
+APP_ENV=development
+APP_DEBUG=true
+"""
+
+
+MAIN = b"""\
+from fastapi import FastAPI
+from src.api.v1.endpoints import health
+
+app = FastAPI(title="DDD FastAPI Service")
+app.include_router(health.router, prefix="/v1")
+"""
+
+
+DEPENDENCIES = b"""\
+from fastapi import Depends
+
+# Placeholder dependencies
+def get_example_dep():
+    return "dep"
+"""
+
+
+SCHEMAS = b"""\
+from pydantic import BaseModel
+
+class HealthResponse(BaseModel):
+    status: str
+"""
+
+
+SAMPLE_ENDPOINT = b"""\
+from fastapi import APIRouter
+from src.api.v1.schemas import HealthResponse
+
+router = APIRouter()
+
+@router.get("/health", response_model=HealthResponse)
+def health():
+    return {"status": "ok"}
+"""
+
+
+TEST_HEALTH = b"""\
+from fastapi.testclient import TestClient
+from src.main import app
+
+client = TestClient(app)
+
+def test_health():
+    resp = client.get("/v1/health")
+    assert resp.status_code == 200
+    assert resp.json()["status"] == "ok"
+"""
 
-def make_main() -> str:
-    return dedent("""
-    from fastapi import FastAPI
-    from src.api.v1.endpoints import health
 
-    app = FastAPI(title="DDD FastAPI Service")
-    app.include_router(health.router, prefix="/v1")
-    """).lstrip()
+CONFIG = b"""\
+from pydantic import BaseSettings, SettingsConfigDict
 
+class Settings(BaseSettings):
+    app_env: str = "development"
+    app_debug: bool = True
 
-def make_dependencies() -> str:
-    return dedent("""
-    from fastapi import Depends
+    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
+settings = Settings()
+"""
 
-    # Placeholder dependencies
-    def get_example_dep():
-        return "dep"
-    """).lstrip()
 
-
-def make_schemas() -> str:
-    return dedent("""
-    from pydantic import BaseModel
-
-    class HealthResponse(BaseModel):
-        status: str
-    """).lstrip()
+# -------------------- SCAFFOLD --------------------
+# Package directories, relative to the project root (each gets an __init__.py)
+PACKAGE_DIRS: tuple[str, ...] = (
+    "src",
+    os.path.join("src", "api"),
+    os.path.join("src", "api", "v1", "endpoints"),
+    os.path.join("src", "api", "v1"),
+    os.path.join("src", "application"),
+    os.path.join("src", "domain"),
+    os.path.join("src", "infrastructure"),
+    os.path.join("tests", "api"),
+    os.path.join("tests", "application"),
+    os.path.join("tests", "domain"),
+    os.path.join("tests", "infrastructure"),
+)
+
+
+def build_plan(project_name: str) -> list[tuple[str, bytes]]:
+    """Return every generated file as (path relative to the project root, content)."""
+    plan = [(os.path.join(d, "__init__.py"), _INIT_BYTES) for d in PACKAGE_DIRS]
+    plan += [
+        # Base files
+        ("pyproject.toml", make_pyproject(project_name)),
+        ("requirements.txt", REQUIREMENTS),
+        ("requirements-tests.txt", REQUIREMENTS_TESTS),
+        ("Dockerfile", DOCKERFILE),
+        (os.path.join("infra", "docker-compose.yml"), make_compose(project_name)),
+        ("Makefile", MAKEFILE),
+        (".gitignore", GITIGNORE),
+        ("pytest.ini", PYTEST_INI),
+        (".importlinter", IMPORTLINTER),
+        ("ruff.toml", RUFF_TOML),
+        (".pre-commit-config.yaml", PRECOMMIT),
+        # Same bytes object, but deliberately two files rather than a hardlink:
+        # .env is git-ignored and edited with secrets, .env.example is committed.
+        (os.path.join("src", ".env.example"), ENV_EXAMPLE),
+        (os.path.join("src", ".env"), ENV_EXAMPLE),
+        # Base code
+        (os.path.join("src", "main.py"), MAIN),
+        (os.path.join("src", "api", "v1", "dependencies.py"), DEPENDENCIES),
+        (os.path.join("src", "api", "v1", "schemas.py"), SCHEMAS),
+        (os.path.join("src", "api", "v1", "endpoints", "health.py"), SAMPLE_ENDPOINT),
+        (os.path.join("src", "config.py"), CONFIG),
+        # Base tests
+        (os.path.join("tests", "api", "test_health.py"), TEST_HEALTH),
+    ]
+    return plan
 
 
-def make_sample_endpoint() -> str:
-    return dedent("""
-    from fastapi import APIRouter
-    from src.api.v1.schemas import HealthResponse
+def scaffold(
+    project_path: str, project_name: str, force: bool = False, archive: bool = False
+) -> None:
+    if archive:
+        scaffold_archive(project_path, project_name, force)
+        return
 
-    router = APIRouter()
+    root = _join(project_path, project_name)
+    if _nonempty(root) and not force:
+        sys.stderr.write(
+            f"[ERROR] Target path already exists and is not empty: {root}\n"
+        )
+        sys.exit(1)
 
-    @router.get("/health", response_model=HealthResponse)
-    def health():
-        return {"status": "ok"}
-    """).lstrip()
+    plan = [
+        (os.path.join(root, name), content)
+        for name, content in build_plan(project_name)
+    ]
+    write_plan(plan, force)
 
+    sys.stdout.write(f"[OK] Project generated at: {root}\n")
 
-def make_test_health() -> str:
-    return dedent("""
-    from fastapi.testclient import TestClient
-    from src.main import app
 
-    client = TestClient(app)
+def scaffold_archive(project_path: str, project_name: str, force: bool = False) -> None:
+    """Write the project as a single uncompressed tar instead of a directory tree."""
+    target = _join(project_path, f"{project_name}.tar")
+    if os.path.exists(target) and not force:
+        sys.stderr.write(f"[ERROR] Target archive already exists: {target}\n")
+        sys.exit(1)
 
-    def test_health():
-        resp = client.get("/v1/health")
-        assert resp.status_code == 200
-        assert resp.json()["status"] == "ok"
-    """).lstrip()
+    os.makedirs(os.path.dirname(target) or ".", exist_ok=True)
+    write_archive(target, project_name, build_plan(project_name))
 
+    sys.stdout.write(f"[OK] Project archive generated at: {target}\n")
 
-def make_config() -> str:
-    return dedent("""
-    from pydantic import BaseSettings, SettingsConfigDict
 
-    class Settings(BaseSettings):
-        app_env: str = "development"
-        app_debug: bool = True
-        
-        model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
-    settings = Settings()
-    """).lstrip()
+# -------------------- ARGPARSE --------------------
+_PARSER: "argparse.ArgumentParser | None" = None
 
 
-# -------------------- SCAFFOLD --------------------
-def scaffold(project_path: str, project_name: str, force: bool = False) -> None:
-    root = Path(project_path) / project_name
-    if root.exists() and any(root.iterdir()) and not force:
-        print(f"[ERROR] Target path already exists and is not empty: {root}")
-        sys.exit(1)
+def _get_parser() -> "argparse.ArgumentParser":
+    """Build the CLI parser on first use and reuse it afterwards."""
+    global _PARSER
+    if _PARSER is None:
+        # Imported lazily so library use of this module does not pay for argparse
+        import argparse
 
-    # Directory structure
-    dirs = [
-        root / "src",
-        root / "src" / "api",
-        root / "src" / "api" / "v1" / "endpoints",
-        root / "src" / "api" / "v1",
-        root / "src" / "application",
-        root / "src" / "domain",
-        root / "src" / "infrastructure",
-        root / "tests" / "api",
-        root / "tests" / "application",
-        root / "tests" / "domain",
-        root / "tests" / "infrastructure",
-    ]
-    for d in dirs:
-        d.mkdir(parents=True, exist_ok=True)
-        write_init(d)  # Add __init__.py
-
-    # Base files
-    write_file(root / "pyproject.toml", make_pyproject(project_name), force)
-    write_file(root / "requirements.txt", make_requirements(), force)
-    write_file(root / "requirements-tests.txt", make_requirements_tests(), force)
-    write_file(root / "Dockerfile", make_dockerfile(), force)
-    write_file(root / "infra" / "docker-compose.yml", make_compose(project_name), force)
-    write_file(root / "Makefile", make_makefile(), force)
-    write_file(root / ".gitignore", make_gitignore(), force)
-    write_file(root / "pytest.ini", make_pytest_ini(), force)
-    write_file(root / ".importlinter", make_importlinter(), force)
-    write_file(root / "ruff.toml", make_ruff_toml(), force)
-    write_file(root / ".pre-commit-config.yaml", make_precommit(), force)
-    write_file(root / "src" / ".env.example", make_env_example(), force)
-    write_file(root / "src" / ".env", make_env_example(), force)
-
-    # Base code
-    write_file(root / "src" / "main.py", make_main(), force)
-    write_file(
-        root / "src" / "api" / "v1" / "dependencies.py", make_dependencies(), force
-    )
-    write_file(root / "src" / "api" / "v1" / "schemas.py", make_schemas(), force)
-    write_file(
-        root / "src" / "api" / "v1" / "endpoints" / "health.py",
-        make_sample_endpoint(),
-        force,
-    )
-    write_file(root / "src/config.py", make_config(), force)
-    write_file(root / "src/.env", make_env_example(), force)
-    # Base tests
-    write_file(root / "tests" / "api" / "test_health.py", make_test_health(), force)
-
-    print(f"[OK] Project generated at: {root}")
+        _PARSER = argparse.ArgumentParser(description="Scaffold DDD FastAPI project")
+        _PARSER.add_argument(
+            "--path", "-p", required=True, help="Path to generate the project"
+        )
+        _PARSER.add_argument("--name", "-n", required=True, help="Project name")
+        _PARSER.add_argument(
+            "--force", "-f", action="store_true", help="Overwrite existing files"
+        )
+        _PARSER.add_argument(
+            "--archive",
+            "-a",
+            action="store_true",
+            help="Write a single <name>.tar archive instead of a directory tree",
+        )
+    return _PARSER
 
 
-# -------------------- ARGPARSE --------------------
-def parse_args() -> argparse.Namespace:
-    parser = argparse.ArgumentParser(description="Scaffold DDD FastAPI project")
-    parser.add_argument(
-        "--path", "-p", required=True, help="Path to generate the project"
-    )
-    parser.add_argument("--name", "-n", required=True, help="Project name")
-    parser.add_argument(
-        "--force", "-f", action="store_true", help="Overwrite existing files"
-    )
-    return parser.parse_args()
+def parse_args() -> "argparse.Namespace":
+    return _get_parser().parse_args()
 
 
 def main() -> None:
     args = parse_args()
-    scaffold(args.path, args.name, force=args.force)
+    scaffold(args.path, args.name, force=args.force, archive=args.archive)
 
 
 if __name__ == "__main__":